@@ -11,8 +11,7 @@ import RequestInfo from './components/RequestInfo';
 import ErrorDisplay from './components/ErrorDisplay';
 
 import { useData } from './hooks/useData';
-import { getSection, getDefaultSectionId, componentConfigs } from './config/registry';
-import type { LayoutItem } from './types';
+import { getSection, getDefaultSectionId, getLayoutRows, componentConfigs } from './config/registry';
 
 function App(): JSX.Element {
   const [currentSection, setCurrentSection] = useState<string>(getDefaultSectionId);
@@ -205,60 +204,44 @@ function App(): JSX.Element {
           {!isLoading &&
             apiData &&
             section &&
-            (() => {
-              // Group layout items by row
-              const rowGroups: Record<number, LayoutItem[]> = {};
-              section.layout?.forEach((item) => {
-                const rowItems = rowGroups[item.row] ?? (rowGroups[item.row] = []);
-                rowItems.push(item);
-              });
+            getLayoutRows(section).map(({ row, items }) => (
+              <div
+                key={row}
+                style={{
+                  display: 'flex',
+                  gap: '16px',
+                  marginBottom: '16px',
+                }}
+              >
+                {items.map((item) => {
+                  const componentConfig = componentConfigs[item.component];
+
+                  if (!componentConfig) {
+                    return (
+                      <div
+                        key={item.component}
+                        style={{
+                          flex: 1,
+                          padding: '16px',
+                          backgroundColor: '#fef2f2',
+                          border: '1px solid #fecaca',
+                          borderRadius: '6px',
+                          color: '#dc2626',
+                        }}
+                      >
+                        Component config not found: {item.component}
+                      </div>
+                    );
+                  }
 
-              // Sort rows and render
-              return Object.keys(rowGroups)
-                .map(Number)
-                .sort((a, b) => a - b)
-                .map((rowNum) => {
-                  const items = rowGroups[rowNum]?.sort((a, b) => a.col - b.col) ?? [];
                   return (
-                    <div
-                      key={rowNum}
-                      style={{
-                        display: 'flex',
-                        gap: '16px',
-                        marginBottom: '16px',
-                      }}
-                    >
-                      {items.map((item) => {
-                        const componentConfig = componentConfigs[item.component];
-
-                        if (!componentConfig) {
-                          return (
-                            <div
-                              key={item.component}
-                              style={{
-                                flex: 1,
-                                padding: '16px',
-                                backgroundColor: '#fef2f2',
-                                border: '1px solid #fecaca',
-                                borderRadius: '6px',
-                                color: '#dc2626',
-                              }}
-                            >
-                              Component config not found: {item.component}
-                            </div>
-                          );
-                        }
-
-                        return (
-                          <div key={item.component} style={{ flex: 1 }}>
-                            <DataDisplay componentConfig={componentConfig} apiData={apiData} />
-                          </div>
-                        );
-                      })}
+                    <div key={item.component} style={{ flex: 1 }}>
+                      <DataDisplay componentConfig={componentConfig} apiData={apiData} />
                     </div>
                   );
-                });
-            })()}
+                })}
+              </div>
+            ))}
 
           <RequestInfo apiData={apiData} />
         </main>
@@ -28,18 +28,21 @@ const compactTheme = themeQuartz.withParams({
   cellHorizontalPadding: 8,
 });
 
+// Grid options shared by every table (stable references across renders)
+const defaultColDef: ColDef = {
+  sortable: true,
+  filter: true,
+  resizable: true,
+  floatingFilter: true,
+  minWidth: 50,
+};
+
+const autoSizeStrategy = { type: 'fitCellContents' } as const;
+
 function Table({ data, columns, label }: TableProps): JSX.Element {
   const [copied, setCopied] = useState(false);
   const columnDefs = useMemo(() => convertColumnsToColDefs(columns), [columns]);
 
-  const defaultColDef = useMemo<ColDef>(() => ({
-    sortable: true,
-    filter: true,
-    resizable: true,
-    floatingFilter: true,
-    minWidth: 50,
-  }), []);
-
   const copyToClipboard = useCallback(() => {
     const headers = columns.map(c => c.label).join('\t');
     const rows = (data ?? []).map(row =>
@@ -94,7 +97,7 @@ function Table({ data, columns, label }: TableProps): JSX.Element {
           columnDefs={columnDefs}
           defaultColDef={defaultColDef}
           domLayout="autoHeight"
-          autoSizeStrategy={{ type: 'fitCellContents' }}
+          autoSizeStrategy={autoSizeStrategy}
           columnHoverHighlight={true}
           suppressColumnVirtualisation={true}
         />
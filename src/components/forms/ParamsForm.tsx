@@ -2,7 +2,7 @@
  * ParamsForm - Collapsible form for API request parameters
  */
 
-import { useState, useRef, useEffect } from 'react';
+import { useState, useRef, useEffect, useMemo } from 'react';
 import type { ParamsFormProps, TimeOfDay, EnvironmentConfig } from '../../types';
 
 const AVAILABLE_BOOKS: string[] = [
@@ -42,6 +42,19 @@ const BOOK_GROUPS: Record<string, string[]> = {
 
 const TIME_OF_DAY_OPTIONS: TimeOfDay[] = ['Live', 'Close', 'Open'];
 
+// API dates are YYYYMMDD; <input type="date"> uses YYYY-MM-DD
+const API_DATE_RE = /^(\d{4})(\d{2})(\d{2})$/;
+
+const formatDateForInput = (dateStr: string): string => {
+  const match = API_DATE_RE.exec(dateStr);
+  if (!match) return '';
+  return `${match[1]}-${match[2]}-${match[3]}`;
+};
+
+const parseDateFromInput = (dateStr: string): string => {
+  return dateStr.replace(/-/g, '');
+};
+
 interface DropdownPosition {
   top: number;
   left: number;
@@ -92,14 +105,8 @@ function ParamsForm({
     return () => document.removeEventListener('mousedown', handleClickOutside);
   }, [isBookDropdownOpen]);
 
-  const formatDateForInput = (dateStr: string): string => {
-    if (!dateStr || dateStr.length !== 8) return '';
-    return `${dateStr.slice(0, 4)}-${dateStr.slice(4, 6)}-${dateStr.slice(6, 8)}`;
-  };
-
-  const parseDateFromInput = (dateStr: string): string => {
-    return dateStr.replace(/-/g, '');
-  };
+  // O(1) membership checks when rendering the book list
+  const selectedBooks = useMemo(() => new Set(params.books ?? []), [params.books]);
 
   const handleDateChange = (field: 'env_date' | 'pos_date', value: string): void => {
     onParamsChange({
@@ -124,7 +131,7 @@ function ParamsForm({
 
   const handleBookToggle = (book: string): void => {
     const currentBooks = params.books ?? [];
-    const newBooks = currentBooks.includes(book)
+    const newBooks = selectedBooks.has(book)
       ? currentBooks.filter((b) => b !== book)
       : [...currentBooks, book];
     onParamsChange({
@@ -458,12 +465,12 @@ function ParamsForm({
                       padding: '8px 12px',
                       cursor: 'pointer',
                       fontSize: '13px',
-                      backgroundColor: params.books?.includes(book) ? '#eff6ff' : 'transparent',
+                      backgroundColor: selectedBooks.has(book) ? '#eff6ff' : 'transparent',
                     }}
                   >
                     <input
                       type="checkbox"
-                      checked={params.books?.includes(book) ?? false}
+                      checked={selectedBooks.has(book)}
                       onChange={() => handleBookToggle(book)}
                     />
                     {book}
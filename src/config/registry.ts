@@ -7,6 +7,8 @@
 
 import type {
   SectionConfig,
+  LayoutItem,
+  LayoutRow,
   ComponentConfig,
   NavbarConfig,
   FormatsConfig,
@@ -41,13 +43,43 @@ export const apiConfig = api as ApiConfig;
 // Navbar config (groups with nested sections)
 export const navbarConfig = navbar as NavbarConfig;
 
+// Sections indexed by id once at startup (first occurrence wins)
+const sectionsById = new Map<string, SectionConfig>();
+for (const group of navbarConfig.groups) {
+  for (const section of group.sections) {
+    if (!sectionsById.has(section.id)) sectionsById.set(section.id, section);
+  }
+}
+
 // Helper: get section by id
 export function getSection(id: string): SectionConfig | undefined {
-  for (const group of navbarConfig.groups) {
-    const section = group.sections.find((s: SectionConfig) => s.id === id);
-    if (section) return section;
-  }
-  return undefined;
+  return sectionsById.get(id);
+}
+
+// Helper: get a section's layout grouped into rows, sorted by row then col.
+// Layouts are static, so each section is grouped once and cached by id.
+const layoutRowsCache = new Map<string, LayoutRow[]>();
+
+export function getLayoutRows(section: SectionConfig): LayoutRow[] {
+  const cached = layoutRowsCache.get(section.id);
+  if (cached) return cached;
+
+  const rowGroups = new Map<number, LayoutItem[]>();
+  section.layout?.forEach((item) => {
+    const rowItems = rowGroups.get(item.row);
+    if (rowItems) {
+      rowItems.push(item);
+    } else {
+      rowGroups.set(item.row, [item]);
+    }
+  });
+
+  const rows = [...rowGroups.entries()]
+    .sort(([a], [b]) => a - b)
+    .map(([row, items]) => ({ row, items: items.sort((a, b) => a.col - b.col) }));
+
+  layoutRowsCache.set(section.id, rows);
+  return rows;
 }
 
 // Helper: get first section id (default)
@@ -4,7 +4,7 @@
  * To switch to live API: comment out MOCK section, uncomment API section
  */
 
-import { useState, useCallback } from 'react';
+import { useState, useCallback, useMemo } from 'react';
 import type { ApiResponse, RequestParams, DataSource, UseDataReturn } from '../types';
 import { apiConfig } from '../config/registry';
 import mockApiData from '../../mocks/sampleResponse.json'; // MOCK: comment out for live API
@@ -36,6 +36,19 @@ const joinUrl = (base: string, path: string): string => {
   return `${cleanBase}/${cleanPath}`;
 };
 
+// Serialize params in one pass (arrays as comma-separated values, e.g. books)
+const buildQueryString = (params: RequestParams): string => {
+  const search = new URLSearchParams();
+  for (const [key, value] of Object.entries(params)) {
+    if (Array.isArray(value)) {
+      search.append(key, value.join(','));
+    } else if (value !== undefined && value !== null) {
+      search.append(key, String(value));
+    }
+  }
+  return search.toString();
+};
+
 const today = new Date();
 const DEFAULT_PARAMS: RequestParams = {
   env_date: formatDate(today),
@@ -70,25 +83,18 @@ export function useData(): UseDataReturn {
   const effectiveBaseUrl: string =
     customUrl || (apiConfig.environments[selectedEnv]?.base_url ?? '');
 
-  // Build the full request URL for display (useful for debugging)
-  const buildRequestUrl = useCallback((): string => {
+  // Build the full request URL for display (useful for debugging),
+  // recomputed only when params or the base URL change
+  const requestUrl = useMemo((): string => {
     try {
       const url = new URL(joinUrl(effectiveBaseUrl, apiConfig.endpoints.pos_env));
-      Object.entries(params).forEach(([key, value]) => {
-        if (Array.isArray(value)) {
-          url.searchParams.set(key, value.join(','));
-        } else if (value !== undefined && value !== null) {
-          url.searchParams.set(key, String(value));
-        }
-      });
+      url.search = buildQueryString(params);
       return url.toString();
     } catch {
       return `${effectiveBaseUrl}${apiConfig.endpoints.pos_env}?...`;
     }
   }, [effectiveBaseUrl, params]);
 
-  const requestUrl = buildRequestUrl();
-
   // ════════════════════════════════════════════════════════════════════════════
   // MOCK - comment out this section to use live API
   // ════════════════════════════════════════════════════════════════════════════
@@ -132,17 +138,12 @@ export function useData(): UseDataReturn {
   //   setIsLoading(true);
   //   setError(null);
 
-  //   // Build URL outside try block so it's accessible in catch
-  //   const url = new URL(joinUrl(effectiveBaseUrl, apiConfig.endpoints.pos_env));
-  //   Object.entries(params).forEach(([key, value]) => {
-  //     if (Array.isArray(value)) {
-  //       url.searchParams.set(key, value.join(','));
-  //     } else if (value !== undefined && value !== null) {
-  //       url.searchParams.set(key, String(value));
-  //     }
-  //   });
-
   //   try {
+  //     // Build the real URL here so a malformed base URL is reported below;
+  //     // requestUrl may hold a display-only placeholder
+  //     const url = new URL(joinUrl(effectiveBaseUrl, apiConfig.endpoints.pos_env));
+  //     url.search = buildQueryString(params);
+
   //     const response = await fetch(url.toString(), {
   //       method: 'GET',
   //       headers: { 'Content-Type': 'application/json' },
@@ -167,13 +168,13 @@ export function useData(): UseDataReturn {
   //     }
 
   //     // Add request context
-  //     const context = `\n\n=== Request Context ===\nURL: ${url.toString()}\nParams: ${JSON.stringify(params, null, 2)}`;
+  //     const context = `\n\n=== Request Context ===\nURL: ${requestUrl}\nParams: ${JSON.stringify(params, null, 2)}`;
   //     setError(message + context);
   //     throw err;
   //   } finally {
   //     setIsLoading(false);
   //   }
-  // }, [effectiveBaseUrl, params]);
+  // }, [effectiveBaseUrl, requestUrl, params]);
 
   // ════════════════════════════════════════════════════════════════════════════
 
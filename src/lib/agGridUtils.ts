@@ -8,6 +8,13 @@ import { themeConfig } from '../config/registry';
 
 const theme = themeConfig.colors;
 
+// Number formatters are built once; toLocaleString() would construct one per cell
+const integerFormat = new Intl.NumberFormat('en-US');
+const decimalFormat = new Intl.NumberFormat('en-US', {
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+});
+
 /**
  * Convert ColumnDefinition[] to AG Grid ColDef[]
  */
@@ -21,48 +28,47 @@ export function convertColumnsToColDefs(columns: ColumnDefinition[]): ColDef[] {
   }));
 }
 
+type CellFormatter = (params: ValueFormatterParams) => string;
+
+// One specialized formatter per format type, so cells never branch on format
+const valueFormatters: Record<string, CellFormatter> = {
+  integer: (params) =>
+    params.value == null ? '-' : integerFormat.format(Math.round(Number(params.value))),
+  decimal: (params) =>
+    params.value == null ? '-' : decimalFormat.format(Number(params.value)),
+};
+
+const defaultValueFormatter: CellFormatter = (params) =>
+  params.value == null ? '-' : String(params.value);
+
 /**
- * Get AG Grid valueFormatter based on format type
+ * Get AG Grid valueFormatter based on format type (resolved once per column)
  */
-function getValueFormatter(format: string) {
-  return (params: ValueFormatterParams): string => {
-    const value = params.value;
-    if (value == null) return '-';
-
-    if (format === 'integer') {
-      return Math.round(Number(value)).toLocaleString('en-US');
-    }
-    if (format === 'decimal') {
-      return Number(value).toLocaleString('en-US', {
-        minimumFractionDigits: 2,
-        maximumFractionDigits: 2,
-      });
-    }
-    return String(value);
-  };
+function getValueFormatter(format: string): CellFormatter {
+  return valueFormatters[format] ?? defaultValueFormatter;
 }
 
 /**
  * Get AG Grid cellStyle function for dynamic styling
+ *
+ * Styles only depend on the column config and the value's sign, so the
+ * style objects are built once per column and shared across cells.
  */
 function getCellStyleFn(col: ColumnDefinition) {
-  return (params: CellClassParams): Record<string, string> => {
-    const style: Record<string, string> = {};
-
-    // Background color from column config
-    const bgColor = col.background ? theme.backgrounds[col.background] : undefined;
-    if (bgColor) {
-      style.backgroundColor = bgColor;
-    }
+  // Background color from column config
+  const bgColor = col.background ? theme.backgrounds[col.background] : undefined;
+  const baseStyle: Record<string, string> = bgColor ? { backgroundColor: bgColor } : {};
 
-    // Text color: sign-based or fixed
-    if (col.text_color === 'sign-based') {
+  // Text color: sign-based or fixed
+  if (col.text_color === 'sign-based') {
+    const negativeStyle = { ...baseStyle, color: theme.text.negative ?? '#dc2626' };
+    const positiveStyle = { ...baseStyle, color: theme.text.positive ?? '#1f2937' };
+    return (params: CellClassParams): Record<string, string> => {
       const num = typeof params.value === 'number' ? params.value : 0;
-      style.color = num < 0 ? (theme.text.negative ?? '#dc2626') : (theme.text.positive ?? '#1f2937');
-    } else {
-      style.color = theme.text[col.text_color_value ?? 'default'] ?? '#374151';
-    }
+      return num < 0 ? negativeStyle : positiveStyle;
+    };
+  }
 
-    return style;
-  };
+  const fixedStyle = { ...baseStyle, color: theme.text[col.text_color_value ?? 'default'] ?? '#374151' };
+  return (): Record<string, string> => fixedStyle;
 }
@@ -117,6 +117,12 @@ export interface LayoutItem {
   col: number;
 }
 
+/** Layout items sharing a row, sorted by column */
+export interface LayoutRow {
+  row: number;
+  items: LayoutItem[];
+}
+
 /** Section configuration (within a group) */
 export interface SectionConfig {
   id: string;